@@ -1,12 +1,21 @@
 from fastmcp import FastMCP
 from fastmcp.tools import Tool
+from mcp.types import ToolAnnotations
 from .tools.greet import greet
 from .tools.context import init_context_engine
 
 mcp = FastMCP("Context Engine")
 
 mcp.add_tool(Tool.from_function(greet))
-mcp.add_tool(Tool.from_function(init_context_engine))
+# The methodology context is static text: advertise it as safe to cache and
+# skip the structured copy so the string is sent once, as plain text content.
+mcp.add_tool(
+    Tool.from_function(
+        init_context_engine,
+        annotations=ToolAnnotations(readOnlyHint=True, idempotentHint=True),
+        output_schema=None,
+    )
+)
 
 
 def main():
@@ -3,19 +3,10 @@ Context Engine Tool - MCP Interface
 Provides the init_context_engine tool for MCP clients
 """
 
+from typing import Final
 
-def init_context_engine(random_string: str = "") -> str:
-    """
-    Initializes the conversation by providing the context of the Context Engine's principles and methodology.
-    
-    Args:
-        random_string: Dummy parameter for no-parameter tools
-        
-    Returns:
-        String containing the methodology context
-    """
-    try:
-        context = """
+# Built once at import; the tool hands out the same string on every call.
+_METHODOLOGY_CONTEXT: Final[str] = """
 # Context Engine - Documentation-Driven Development Workflow
 
 ## Overview
@@ -76,9 +67,17 @@ This Context Engine MCP server can be integrated with:
 - Any MCP-compatible client
 
 The server provides tools that help maintain documentation-driven development workflows and ensure high code quality through proper documentation practices.
-"""
-        
-        return context.strip()
+""".strip()
+
+
+def init_context_engine(random_string: str | None = None) -> str:
+    """
+    Initializes the conversation by providing the context of the Context Engine's principles and methodology.
+    
+    Args:
+        random_string: Dummy parameter for no-parameter tools; ignored
         
-    except Exception as e:
-        return f"❌ Error initializing Context Engine: {str(e)}"
+    Returns:
+        String containing the methodology context
+    """
+    return _METHODOLOGY_CONTEXT
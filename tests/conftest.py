@@ -3,6 +3,7 @@ Pytest configuration and shared fixtures for the test suite.
 """
 
 import pytest
+import pytest_asyncio
 from fastmcp import Client
 from context_engine.main import mcp
 
@@ -13,9 +14,9 @@ def mcp_server():
     return mcp
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_mcp_client(mcp_server):
-    """Fixture to provide an async MCP client for testing."""
+    """Fixture to provide an async MCP client shared across the test session."""
     client = Client(mcp_server)
     async with client:
         yield client
@@ -54,3 +54,26 @@ async def test_greet_edge_cases(async_mcp_client):
     # Test with numbers
     result = await async_mcp_client.call_tool("greet", {"name": "User123"})
     assert result.data == "Hello, User123!"
+
+
+@pytest.mark.asyncio
+async def test_init_context_engine_returns_methodology(async_mcp_client):
+    """Test that init_context_engine returns the methodology context."""
+    result = await async_mcp_client.call_tool("init_context_engine", {})
+    text = result.content[0].text
+    assert text.startswith("# Context Engine - Documentation-Driven Development Workflow")
+    assert text == text.strip()
+
+    # Repeated calls hand back the same context
+    again = await async_mcp_client.call_tool("init_context_engine", {})
+    assert again.content[0].text == text
+
+
+@pytest.mark.asyncio
+async def test_init_context_engine_tool_metadata(async_mcp_client):
+    """Test that init_context_engine is advertised as a cacheable, plain-text tool."""
+    tools = {tool.name: tool for tool in await async_mcp_client.list_tools()}
+    tool = tools["init_context_engine"]
+    assert tool.annotations.readOnlyHint is True
+    assert tool.annotations.idempotentHint is True
+    assert tool.outputSchema is None